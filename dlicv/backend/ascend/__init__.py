@@ -2,9 +2,11 @@ from .backend_manager import AscendManager
 
 __all__ = ['AscendManager']
 
-if AscendManager.is_available():
-    try:
+
+def __getattr__(name):
+    # Defer loading `.backend` (and with it the ACL runtime) until the
+    # backend class is actually requested.
+    if name == 'AscendBackend':
         from .backend import AscendBackend
-        __all__ += ['AscendBackend']
-    except Exception:
-        pass
+        return AscendBackend
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
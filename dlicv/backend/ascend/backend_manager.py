@@ -1,7 +1,24 @@
-import os.path as osp
+import importlib.util
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
 from typing import Callable, Optional, Sequence
 
 from ..base import BACKEND_MANAGERS, BaseBackendManager
+from ..base.backend_manager import _resolve_engine_path
+
+# Availability cannot change within a process; probe once at import
+# instead of walking `sys.path` per call.
+_ASCEND_AVAILABLE = (importlib.util.find_spec('aclruntime') is not None
+                     and importlib.util.find_spec('ais_bench') is not None)
+
+
+@lru_cache(maxsize=None)
+def _package_version(package: str) -> str:
+    """Query the installed version of a package without `pkg_resources`."""
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return 'None'
 
 
 @BACKEND_MANAGERS.register('ascend')
@@ -30,9 +47,7 @@ class AscendManager(BaseBackendManager):
                 Defaults to None.
         """
         from .backend import AscendBackend
-        backend_file = osp.expanduser(backend_files[0])
-        if not osp.isfile(backend_file):
-            raise FileNotFoundError(f'`{backend_file}` not found.')
+        backend_file = _resolve_engine_path(backend_files[0])
         return AscendBackend(model_file=backend_file, device_id=device_id)
 
     @classmethod
@@ -43,9 +58,7 @@ class AscendManager(BaseBackendManager):
         Returns:
             bool: True if backend package is installed.
         """
-        import importlib
-        return importlib.util.find_spec('aclruntime') is not None and \
-               importlib.util.find_spec('ais_bench') is not None
+        return _ASCEND_AVAILABLE
 
     @classmethod
     def get_version(cls) -> str:
@@ -53,33 +66,35 @@ class AscendManager(BaseBackendManager):
         if not cls.is_available():
             return 'None'
         else:
-            import pkg_resources
-            try:
-                return pkg_resources.get_distribution('ais_bench').version
-            except Exception:
-                return 'None'
+            return _package_version('ais_bench')
     
     @classmethod
-    def check_env(cls, log_callback: Callable = lambda _: _) -> str:
+    def check_env(cls,
+                  log_callback: Callable = lambda _: _,
+                  force: bool = False) -> str:
         """Check current environment.
 
         Returns:
             str: Info about the environment.
         """
-        import pkg_resources
-
+        info = cls.__dict__.get('_cached_env_info', None)
+        if info is not None and not force:
+            log_callback(info)
+            return info
         try:
             if cls.is_available():
-                aclruntime_version = pkg_resources.get_distribution(
-                    'aclruntime').version
-                ais_bench_version = pkg_resources.get_distribution(
-                        'ais_bench').version
+                aclruntime_version = _package_version('aclruntime')
+                ais_bench_version = _package_version('ais_bench')
                 aclruntime_info = f'aclruntime:\t{aclruntime_version}'
                 log_callback(aclruntime_info)
                 ais_bench_info = f'ais_bench:\t{ais_bench_version}'
                 log_callback(ais_bench_info)
                 info = f'{aclruntime_info}\n{ais_bench_info}'
+            else:
+                info = f'{cls.backend_name}:\tNone'
+                log_callback(info)
         except Exception:
             info = f'{cls.backend_name}:\tCheckFailed'
             log_callback(info)
+        cls._cached_env_info = info
         return info
@@ -1,16 +1,60 @@
 # This file is modified from `mmdepoly` 
 # https://github.com/open-mmlab/mmdeploy/blob/main/mmdeploy/backend/base/backend_manager.py
 import importlib
+import os
+import os.path as osp
+import stat
 from abc import ABCMeta
+from functools import lru_cache
 from typing import Callable, Optional, Sequence
 
+from dlicv.utils import Backend, get_root_logger
 from .base_backend import BaseBackend
 
 
+@lru_cache(maxsize=256)
+def _resolve_engine_path(path: str) -> str:
+    """Expand and validate a backend model file path.
+
+    Resolved paths are cached, so rebuilding a backend from the same
+    file skips the repeated filesystem stat.
+    """
+    path = osp.expanduser(path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        raise FileNotFoundError(f'`{path}` not found.') from None
+    if not stat.S_ISREG(st.st_mode):
+        raise FileNotFoundError(f'`{path}` not found.')
+    return path
+
+
+def _extend_backend_enum(enum_name: str, value: str):
+    """Add a new member to the `Backend` enum in place.
+
+    A trimmed-down replacement for ``aenum.extend_enum``: only the
+    member maps the registry relies on are updated, so registering a
+    backend does not pay for the full enum re-validation machinery (nor
+    for the third-party ``aenum`` import).
+    """
+    member = object.__new__(Backend)
+    member._name_ = enum_name
+    member._value_ = value
+    # bypass EnumMeta.__setattr__, which forbids member assignment
+    type.__setattr__(Backend, enum_name, member)
+    Backend._member_map_[enum_name] = member
+    Backend._member_names_.append(enum_name)
+    Backend._value2member_map_[value] = member
+
+
 class BaseBackendManager(metaclass=ABCMeta):
-    """Abstract interface of backend manager. 
+    """Abstract interface of backend manager.
     """
 
+    # per-class cache of the `check_env` info string; the environment
+    # does not change within a process
+    _cached_env_info: Optional[str] = None
+
     @classmethod
     def build_backend(cls,
                       backend_files: Sequence[str],
@@ -51,11 +95,21 @@ class BaseBackendManager(metaclass=ABCMeta):
             f'get_version has not been implemented for "{cls.__name__}"')
 
     @classmethod
-    def check_env(cls, log_callback: Callable = lambda _: _) -> str:
+    def check_env(cls,
+                  log_callback: Callable = lambda _: _,
+                  force: bool = False) -> str:
         """Check current environment.
+        Args:
+            log_callback (Callable): Callback to log the info string.
+            force (bool): Recompute the info string instead of returning
+                the cached one. Defaults to False.
         Returns:
             str: Info about the environment.
         """
+        info = cls.__dict__.get('_cached_env_info', None)
+        if info is not None and not force:
+            log_callback(info)
+            return info
         try:
             available = cls.is_available()
             if available:
@@ -70,6 +124,7 @@ class BaseBackendManager(metaclass=ABCMeta):
         except Exception:
             info = f'{cls.backend_name}:\tCheckFailed'
 
+        cls._cached_env_info = info
         log_callback(info)
         return info
 
@@ -79,6 +134,12 @@ class BackendManagerRegistry:
 
     def __init__(self):
         self._module_dict = {}
+        self._imported = set()
+        self._backend_members = frozenset(Backend.__members__)
+        # Manager lookup sits on the per-inference construction path;
+        # cache resolved classes so repeated lookups skip the import
+        # machinery entirely.
+        self._find = lru_cache(maxsize=None)(self._resolve)
 
     def register(self, name: str, enum_name: Optional[str] = None):
         """register backend manager.
@@ -87,7 +148,6 @@ class BackendManagerRegistry:
             enum_name (Optional[str], optional): enum name of the backend.
                 if not given, the upper case of name would be used.
         """
-        from dlicv.utils import get_root_logger
         logger = get_root_logger()
 
         if enum_name is None:
@@ -95,11 +155,9 @@ class BackendManagerRegistry:
 
         def wrap_manager(cls):
 
-            from dlicv.utils import Backend
-
-            if not hasattr(Backend, enum_name):
-                from aenum import extend_enum
-                extend_enum(Backend, enum_name, name)
+            if enum_name not in self._backend_members:
+                _extend_backend_enum(enum_name, name)
+                self._backend_members = frozenset(Backend.__members__)
                 logger.info(f'Registry new backend: {enum_name} = {name}.')
 
             if name in self._module_dict:
@@ -111,10 +169,24 @@ class BackendManagerRegistry:
 
             cls.backend_name = name
 
+            # make the new registration visible to cached lookups
+            self._find.cache_clear()
+
             return cls
 
         return wrap_manager
 
+    def _resolve(self, name: str) -> BaseBackendManager:
+        """Resolve the backend manager with name."""
+        manager = self._module_dict.get(name, None)
+        if manager is None and name not in self._imported:
+            # try import backend if backend is in `backend`; the manager
+            # registers itself on import of its subpackage
+            self._imported.add(name)
+            importlib.import_module('dlicv.backend.' + name)
+            manager = self._module_dict.get(name, None)
+        return manager
+
     def find(self, name: str) -> BaseBackendManager:
         """Find the backend manager with name.
         Args:
@@ -122,9 +194,7 @@ class BackendManagerRegistry:
         Returns:
             BaseBackendManager: backend manager of the given backend.
         """
-        # try import backend if backend is in `backend`
-        importlib.import_module('dlicv.backend.' + name)
-        return self._module_dict.get(name, None)
+        return self._find(name)
 
 
 BACKEND_MANAGERS = BackendManagerRegistry()
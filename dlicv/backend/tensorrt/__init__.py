@@ -3,9 +3,11 @@ from .backend_manager import TensorRTManager
 
 __all__ = ['TensorRTManager']
 
-if TensorRTManager.is_available():
-    try:
+
+def __getattr__(name):
+    # Defer loading `.backend` (and with it the TensorRT bindings) until
+    # the backend class is actually requested.
+    if name == 'TRTBackend':
         from .backend import TRTBackend
-        __all__ += ['TRTBackend']
-    except Exception:
-        pass
+        return TRTBackend
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,6 +1,7 @@
 # This file is modified from `mmdeploy`
 # https://github.com/open-mmlab/mmdeploy/blob/main/mmdeploy/backend/tensorrt/wrapper.py
-from typing import Sequence, Dict
+import mmap
+from typing import Dict, Optional, Sequence
 
 import tensorrt as trt
 import torch
@@ -52,11 +53,37 @@ def torch_device_from_trt(device: trt.TensorLocation):
         return TypeError(f'{device} is not supported by torch')
 
 
+def _deserialize_engine(engine_file: str) -> trt.ICudaEngine:
+    """Deserialize a TensorRT engine from file.
+
+    The file is mapped read-only instead of read into a `bytes` object:
+    `deserialize_cuda_engine` accepts any buffer, and mapping avoids
+    double-buffering multi-GB engine plans in host memory.
+
+    Args:
+        engine_file (str): TensorRT engine file.
+
+    Returns:
+        trt.ICudaEngine: The deserialized engine.
+    """
+    with trt.Logger() as logger, trt.Runtime(logger) as runtime:
+        trt.init_libnvinfer_plugins(logger, namespace='')
+        with open(engine_file, mode='rb') as f, \
+                mmap.mmap(f.fileno(), 0,
+                          access=mmap.ACCESS_READ) as engine_buffer:
+            # TensorRT copies the plan into device memory while
+            # deserializing, so the mapping is released right after.
+            return runtime.deserialize_cuda_engine(engine_buffer)
+
+
 class TRTBackend(BaseBackend):
     """TensorRT backbend for inference.
     Args:
         engine_file (str): TensorRT engine file.
         device_id (int): A number specifying the cuda device id.
+        engine (trt.ICudaEngine | None): A prebuilt engine deserialized
+            from `engine_file`. If given, deserialization is skipped.
+            Defaults to None.
 
     Examples:
         >>> from dlicv.backend.tensorrt import TRTBackend
@@ -67,14 +94,15 @@ class TRTBackend(BaseBackend):
         >>> print(outputs)
     """
 
-    def __init__(self, engine_file: str, device_id: int = 0):
+    def __init__(self,
+                 engine_file: str,
+                 device_id: int = 0,
+                 engine: Optional[trt.ICudaEngine] = None):
         self.torch_device = torch.device('cuda', device_id)
         self.allocator = TorchAllocator(device_id)
-        with trt.Logger() as logger, trt.Runtime(logger) as runtime:
-            with open(engine_file, mode='rb') as f:
-                engine_bytes = f.read()
-            trt.init_libnvinfer_plugins(logger, namespace='')
-            self.engine = runtime.deserialize_cuda_engine(engine_bytes)
+        if engine is None:
+            engine = _deserialize_engine(engine_file)
+        self.engine = engine
         self.context = self.engine.create_execution_context()
 
         if hasattr(self.context, 'temporary_allocator'):
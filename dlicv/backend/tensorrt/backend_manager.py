@@ -1,7 +1,36 @@
-import os.path as osp
+import importlib.util
+import os
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
 from typing import Callable, Optional, Sequence
 
 from ..base import BACKEND_MANAGERS, BaseBackendManager
+from ..base.backend_manager import _resolve_engine_path
+
+# Availability cannot change within a process; probe once at import
+# instead of walking `sys.path` per call.
+_TRT_AVAILABLE = importlib.util.find_spec('tensorrt') is not None
+
+
+@lru_cache(maxsize=None)
+def _package_version(package: str) -> str:
+    """Query the installed version of a package without `pkg_resources`."""
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return 'None'
+
+
+# Deserialized engines keyed by (path, mtime, device id). Engine
+# deserialization is deterministic for a given file and can take
+# minutes on embedded devices, so rebuilt backends reuse the cached
+# engine for the lifetime of the process.
+_ENGINE_CACHE = {}
+
+# A CUDA context inherited across fork is invalid in the child; drop the
+# cached engines so each worker deserializes against its own context.
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_ENGINE_CACHE.clear)
 
 
 @BACKEND_MANAGERS.register('tensorrt')
@@ -29,11 +58,14 @@ class TensorRTManager(BaseBackendManager):
             output_names (Optional[Sequence[str]], optional): output names.
                 Defaults to None.
         """
-        from .backend import TRTBackend
-        backend_file = osp.expanduser(backend_files[0])
-        if not osp.isfile(backend_file):
-            raise FileNotFoundError(f'`{backend_file}` not found.')
-        return TRTBackend(engine_file=backend_file)
+        from .backend import TRTBackend, _deserialize_engine
+        backend_file = _resolve_engine_path(backend_files[0])
+        key = (backend_file, os.stat(backend_file).st_mtime_ns, device_id)
+        engine = _ENGINE_CACHE.get(key)
+        if engine is None:
+            engine = _deserialize_engine(backend_file)
+            _ENGINE_CACHE[key] = engine
+        return TRTBackend(engine_file=backend_file, engine=engine)
 
     @classmethod
     def is_available(cls, with_custom_ops: bool = False) -> bool:
@@ -43,8 +75,7 @@ class TensorRTManager(BaseBackendManager):
         Returns:
             bool: True if backend package is installed.
         """
-        import importlib
-        return importlib.util.find_spec('tensorrt') is not None
+        return _TRT_AVAILABLE
 
     @classmethod
     def get_version(cls) -> str:
@@ -52,17 +83,15 @@ class TensorRTManager(BaseBackendManager):
         if not cls.is_available():
             return 'None'
         else:
-            import pkg_resources
-            try:
-                return pkg_resources.get_distribution('tensorrt').version
-            except Exception:
-                return 'None'
+            return _package_version('tensorrt')
     
     @classmethod
-    def check_env(cls, log_callback: Callable = lambda _: _) -> str:
+    def check_env(cls,
+                  log_callback: Callable = lambda _: _,
+                  force: bool = False) -> str:
         """Check current environment.
 
         Returns:
             str: Info about the environment.
         """
-        return super().check_env(log_callback=log_callback)
+        return super().check_env(log_callback=log_callback, force=force)
@@ -1,12 +1,35 @@
-from .base import BaseTransform
-from .conversion import ImgToTensor, Normalize 
-from .fromatting import PackImgInputs
-from .geometry import Resize, Pad
-from .loading import LoadImage, LoadImgFromNDArray, LoadImgFromTensor
-from .wrappers import Compose
+import importlib
+
+# Lazily resolved re-exports (PEP 562): importing this package no longer
+# pulls every transform module (and numpy/torch behind them) eagerly.
+_LAZY_ATTRS = {
+    'BaseTransform': '.base',
+    'Compose': '.wrappers',
+    'LoadImage': '.loading',
+    'LoadImgFromNDArray': '.loading',
+    'LoadImgFromTensor': '.loading',
+    'Resize': '.geometry',
+    'Pad': '.geometry',
+    'ImgToTensor': '.conversion',
+    'Normalize': '.conversion',
+    'PackImgInputs': '.fromatting',
+}
 
 __all__ = [
-    'BaseTransform', 'Compose', 'LoadImage', 'LoadImgFromNDArray', 
-    'LoadImgFromTensor', 'Resize', 'Pad', 'ImgToTensor', 'Normalize', 
+    'BaseTransform', 'Compose', 'LoadImage', 'LoadImgFromNDArray',
+    'LoadImgFromTensor', 'Resize', 'Pad', 'ImgToTensor', 'Normalize',
     'PackImgInputs'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return __all__
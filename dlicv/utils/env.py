@@ -1,6 +1,9 @@
 import importlib
+from collections.abc import Mapping
+from functools import lru_cache
 
 
+@lru_cache(maxsize=None)
 def get_library_version(lib):
     """Try to get the version of a library if it has been installed.
 
@@ -22,14 +25,36 @@ def get_library_version(lib):
     return version
 
 
+class _BackendVersionMap(Mapping):
+    """Lazy mapping from backend library name to installed version.
+
+    Versions are resolved through :func:`get_library_version` on first
+    access, so querying one backend does not import the others.
+    """
+
+    _backend_library_list = ('tensorrt', 'onnxruntime')
+
+    def __getitem__(self, lib):
+        if lib not in self._backend_library_list:
+            raise KeyError(lib)
+        return get_library_version(lib)
+
+    def __iter__(self):
+        return iter(self._backend_library_list)
+
+    def __len__(self):
+        return len(self._backend_library_list)
+
+
+_backend_version_map = _BackendVersionMap()
+
+
 def get_backend_version():
-    """Get the version dictionary of some supported backend.
+    """Get the version mapping of some supported backend.
 
     Returns:
-        Dict: The name and the version of some supported backend.
+        Mapping: The name and the version of some supported backend.
+        Versions are resolved lazily per key, so e.g. indexing
+        ``'onnxruntime'`` does not import tensorrt.
     """
-    backend_library_list = ['tensorrt', 'onnxruntime']
-    version_dict = dict()
-    for backend in backend_library_list:
-        version_dict[backend] = get_library_version(backend)
-    return version_dict
\ No newline at end of file
+    return _backend_version_map
\ No newline at end of file